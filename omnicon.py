@@ -6,6 +6,7 @@
 # NOT FOR DISTRIBUTION OR USE OUTSIDE OF OMNICON PRODUCTS
 
 import time
+import bisect
 import board
 import busio
 import digitalio
@@ -13,46 +14,103 @@ from PIL import Image, ImageDraw, ImageFont
 import adafruit_ssd1306
 import subprocess
 import json
+try:
+    import orjson  # Optional accelerated JSON; state files parse ~5x faster
+except ImportError:
+    orjson = None
+try:
+    import pydbus  # Optional: query NetworkManager over D-Bus instead of forking nmcli
+except ImportError:
+    pydbus = None
 import logging
-from gpiozero import Button
 import lgpio
 import threading
-from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
 import os
 import sys
 import psutil  # Added for accurate CPU usage
+import numpy as np
 import requests
 import re
+import shutil
+import string
 import socket
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(message)s')
 
+# Precompiled patterns used on hot paths
+_VER_RE = re.compile(r'^(\d+\.\d+\.\d+)')
+_CLOCK_FMT_RE = re.compile(r'^clock_format=.*$', re.M)
+
 # GPIO setup
 BUTTON_K1 = 26  # Using GPIO pin 26
 BUTTON_K2 = 19  # Using GPIO pin 19
 BUTTON_K3 = 13  # Using GPIO pin 13
 BUTTON_K4 = 6   # Using GPIO pin 6
 
-# Release GPIO pins
-def release_gpio_pins(pins):
-    h = lgpio.gpiochip_open(0)
-    for pin in pins:
-        try:
-            lgpio.gpio_claim_input(h, pin)
-        except lgpio.error as e:
-            logging.warning(f"GPIO pin {pin} could not be claimed: {e}")
-    lgpio.gpiochip_close(h)
-
-# Release the GPIO pins
-release_gpio_pins([BUTTON_K1, BUTTON_K2, BUTTON_K3, BUTTON_K4])
+# gpiozero's Button services the pins from polling threads, which costs
+# noticeable CPU on a Pi Zero. lgpio is already in use for pin cleanup, so
+# claim kernel edge alerts instead and dispatch from lgpio's callback thread.
+class LgpioButton:
+    def __init__(self, handle, pin, hold_time=1.0, bounce_time=0.1, hold_repeat=False):
+        self.pin = pin
+        self.hold_time = hold_time
+        self.hold_repeat = hold_repeat
+        self.when_pressed = None
+        self.when_held = None
+        self.is_pressed = False
+        self.is_held = False
+        self._hold_timer = None
+        lgpio.gpio_claim_alert(handle, pin, lgpio.BOTH_EDGES, lgpio.SET_PULL_UP)
+        # Kernel-side glitch filter: edges shorter than bounce_time never
+        # surface to userspace, so no per-event timestamp bookkeeping here
+        lgpio.gpio_set_debounce_micros(handle, pin, int(bounce_time * 1_000_000))
+        self._callback = lgpio.callback(handle, pin, lgpio.BOTH_EDGES, self._on_edge)
+
+    def _on_edge(self, chip, gpio, level, timestamp):
+        if level == lgpio.TIMEOUT:
+            return
+        if level == 0:  # Falling edge: pressed (pins are pulled up)
+            self.is_pressed = True
+            self._start_hold_timer()
+            if self.when_pressed:
+                self.when_pressed()
+        else:  # Rising edge: released
+            self.is_pressed = False
+            self.is_held = False
+            self._cancel_hold_timer()
+
+    def _start_hold_timer(self):
+        self._cancel_hold_timer()
+        self._hold_timer = threading.Timer(self.hold_time, self._on_hold)
+        self._hold_timer.daemon = True
+        self._hold_timer.start()
+
+    def _cancel_hold_timer(self):
+        if self._hold_timer is not None:
+            self._hold_timer.cancel()
+            self._hold_timer = None
+
+    def _on_hold(self):
+        if not self.is_pressed:
+            return
+        self.is_held = True
+        if self.when_held:
+            self.when_held()
+        if self.hold_repeat and self.is_pressed:
+            self._start_hold_timer()
 
 # Initialize buttons
 try:
-    button_k1 = Button(BUTTON_K1, pull_up=True, hold_time=0.3, bounce_time=0.1, hold_repeat=True)
-    button_k2 = Button(BUTTON_K2, pull_up=True, hold_time=0.3, bounce_time=0.1, hold_repeat=True)
-    button_k3 = Button(BUTTON_K3, pull_up=True, hold_time=1, bounce_time=0.1)
-    button_k4 = Button(BUTTON_K4, pull_up=True, hold_time=1, bounce_time=0.1)
+    gpio_handle = lgpio.gpiochip_open(0)
+    button_k1 = LgpioButton(gpio_handle, BUTTON_K1, hold_time=0.3, bounce_time=0.1)
+    button_k2 = LgpioButton(gpio_handle, BUTTON_K2, hold_time=0.3, bounce_time=0.1)
+    button_k3 = LgpioButton(gpio_handle, BUTTON_K3, hold_time=1, bounce_time=0.1)
+    button_k4 = LgpioButton(gpio_handle, BUTTON_K4, hold_time=1, bounce_time=0.1)
     logging.info('Buttons initialized successfully')
 except lgpio.error as e:
     logging.error(f"Error initializing GPIO pins: {e}")
@@ -62,42 +120,59 @@ except lgpio.error as e:
 DHCP_PROFILE = "DHCP"
 STATIC_PROFILE = "STATIC"
 
-# Define terminal commands for services
-command_start_companion = "sudo systemctl start companion.service"
-command_stop_companion = "sudo systemctl stop companion.service"
-command_start_satellite = "sudo systemctl start satellite.service"
-command_stop_satellite = "sudo systemctl stop satellite.service"
+# Define terminal commands for services (argv lists; no shell involved)
+command_start_companion = ["sudo", "systemctl", "start", "companion.service"]
+command_stop_companion = ["sudo", "systemctl", "stop", "companion.service"]
+command_start_satellite = ["sudo", "systemctl", "start", "satellite.service"]
+command_stop_satellite = ["sudo", "systemctl", "stop", "satellite.service"]
+
+# TTL cache for subprocess-backed lookups; results are reused until the TTL
+# expires or the caller explicitly clears the cache after changing state.
+def ttl_cache(seconds):
+    def decorator(func):
+        cache = {}
+
+        def wrapper(*args):
+            now = time.monotonic()
+            hit = cache.get(args)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            value = func(*args)
+            cache[args] = (now + seconds, value)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
 
 # RETRIEVE COMPANION & SATELLITE VERSION
-def get_companion_version():
+# package.json only changes on an app update, so cache the parsed version
+# keyed on the file's mtime and reparse only when it actually changed.
+_version_cache = {}
+
+def _read_package_version(path):
     try:
-        with open('/opt/companion/package.json', 'r') as f:
+        mtime = os.stat(path).st_mtime_ns
+        cached = _version_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(path, 'r') as f:
             data = json.load(f)
-            version = data.get('version', 'Unknown')
-            # Extract only the first three numbers
-            match = re.match(r'^(\d+\.\d+\.\d+)', version)
-            if match:
-                return match.group(1)
-            else:
-                return 'Unknown'
+        version = data.get('version', 'Unknown')
+        # Extract only the first three numbers
+        match = _VER_RE.match(version)
+        version = match.group(1) if match else 'Unknown'
+        _version_cache[path] = (mtime, version)
+        return version
     except Exception as e:
-        logging.error(f"Error reading companion version: {e}")
+        logging.error(f"Error reading version from {path}: {e}")
         return 'Unknown'
 
+def get_companion_version():
+    return _read_package_version('/opt/companion/package.json')
+
 def get_satellite_version():
-    try:
-        with open('/opt/companion-satellite/satellite/package.json', 'r') as f:
-            data = json.load(f)
-            version = data.get('version', 'Unknown')
-            # Extract only the first three numbers
-            match = re.match(r'^(\d+\.\d+\.\d+)', version)
-            if match:
-                return match.group(1)
-            else:
-                return 'Unknown'
-    except Exception as e:
-        logging.error(f"Error reading satellite version: {e}")
-        return 'Unknown'
+    return _read_package_version('/opt/companion-satellite/satellite/package.json')
 
 # State file
 STATE_FILE = "state.json"
@@ -107,7 +182,13 @@ time_format_24hr = True  # True for 24-hour format, False for 12-hour format
 available_versions = []  # To store fetched versions
 selected_version = None  # Initialize selected_version at the global level
 updating_application = False
+# Two-stage locking splits frame building from the I2C burst: frame_lock
+# guards the shared PIL frame while a screen is composed, oled_lock guards
+# the panel buffer and bus. A thread may compose the next frame while the
+# previous one is still being transmitted.
+frame_lock = threading.Lock()
 oled_lock = threading.Lock()
+display_dirty = threading.Event()  # Set by input handlers to request a repaint
 
 # Function to get current version from the script
 def get_current_version():
@@ -123,25 +204,43 @@ def get_current_version():
 
 # Update the update_menu dynamically
 current_version = get_current_version()
+try:
+    _current_version_tuple = tuple(map(int, current_version.lstrip('vV').split('.')))
+except ValueError:
+    _current_version_tuple = ()
 update_menu = [f"CURRENT: {current_version}", "UPDATE", "DOWNGRADE", "EXIT"]
 
+# In-memory state cache; the file is only re-read when its mtime changes
+# (e.g. an external edit), so per-frame callers pay one stat, not a parse.
+_state_cache = None
+_state_mtime = None
+
 # Function to load state from file
 def load_state():
+    global _state_cache, _state_mtime
+
     def parse_ip_octets(ip):
         if isinstance(ip, list):
             return [int(octet) for octet in ip]
         return [int(octet) for octet in ip.split('.') if octet.isdigit()]
 
     try:
-        with open(STATE_FILE, 'r') as f:
-            state = json.load(f)
-            state["static_ip"] = parse_ip_octets(state.get("static_ip", "192.168.0.100"))
-            state["subnet_mask"] = parse_ip_octets(state.get("subnet_mask", "255.255.255.0"))
-            state["gateway"] = parse_ip_octets(state.get("gateway", "192.168.0.1"))
-            state["time_format_24hr"] = state.get("time_format_24hr", True)
-            return state
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {
+        mtime = os.stat(STATE_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _state_cache is not None and mtime == _state_mtime:
+        return _state_cache
+
+    try:
+        with open(STATE_FILE, 'rb') as f:
+            raw = f.read()
+        state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        state["static_ip"] = parse_ip_octets(state.get("static_ip", "192.168.0.100"))
+        state["subnet_mask"] = parse_ip_octets(state.get("subnet_mask", "255.255.255.0"))
+        state["gateway"] = parse_ip_octets(state.get("gateway", "192.168.0.1"))
+        state["time_format_24hr"] = state.get("time_format_24hr", True)
+    except (FileNotFoundError, ValueError):
+        state = {
             "service": "companion",
             "network": "STATIC",
             "static_ip": [192, 168, 0, 100],
@@ -149,11 +248,22 @@ def load_state():
             "gateway": [192, 168, 0, 1],
             "time_format_24hr": True
         }
+    _state_cache = state
+    _state_mtime = mtime
+    return state
 
+@ttl_cache(seconds=5)
 def is_connected():
+    # A connected UDP socket only checks that a route exists - no handshake,
+    # no packets on the wire - unlike the old TCP connect that blocked for
+    # up to 2 seconds against a DNS port.
     try:
-        # Try to connect to a known server (Google DNS)
-        socket.create_connection(("8.8.8.8", 53), timeout=2)
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            s.settimeout(0.5)
+            s.connect(("8.8.8.8", 53))
+        finally:
+            s.close()
         return True
     except OSError:
         pass
@@ -162,24 +272,67 @@ def is_connected():
 
 # Function to save state to file
 def save_state(state):
-    with open(STATE_FILE, 'w') as f:
-        json.dump(state, f)
+    global _state_cache, _state_mtime
+    data = orjson.dumps(state) if orjson is not None else json.dumps(state).encode()
+    with open(STATE_FILE, 'wb') as f:
+        f.write(data)
+    _state_cache = state
+    try:
+        _state_mtime = os.stat(STATE_FILE).st_mtime_ns
+    except OSError:
+        _state_mtime = None
 
-# Function to execute a command
+# Function to execute a command; argv lists run without the extra /bin/sh fork
 def execute_command(command):
-    subprocess.run(command, shell=True)
+    subprocess.run(command)
+
+_MANAGED_UNITS = ("companion.service", "satellite.service")
+
+# systemctl accepts several unit names and prints one state per line, so
+# both services are checked with a single fork
+@ttl_cache(seconds=5)
+def systemctl_is_active(units):
+    result = subprocess.run(["systemctl", "is-active", *units], capture_output=True, text=True)
+    return {unit: state == "active" for unit, state in zip(units, result.stdout.splitlines())}
 
 # Function to check if a service is active
 def is_service_active(service_name):
-    result = subprocess.run(["systemctl", "is-active", service_name], capture_output=True, text=True)
-    return result.stdout.strip() == "active"
+    return systemctl_is_active(_MANAGED_UNITS).get(service_name, False)
+
+_system_bus = None
+
+def _get_system_bus():
+    # One persistent D-Bus connection; opened lazily and never retried if the
+    # bus is unavailable so a broken setup degrades to the nmcli fallback
+    global _system_bus
+    if pydbus is None:
+        return None
+    if _system_bus is None:
+        try:
+            _system_bus = pydbus.SystemBus()
+        except Exception as e:
+            logging.warning(f"D-Bus unavailable, falling back to nmcli: {e}")
+            _system_bus = False
+    return _system_bus or None
 
 # Function to get active network connection
+@ttl_cache(seconds=5)
 def get_active_connection():
+    bus = _get_system_bus()
+    if bus is not None:
+        try:
+            nm = bus.get('org.freedesktop.NetworkManager')
+            for path in nm.ActiveConnections:
+                name = bus.get('org.freedesktop.NetworkManager', path).Id
+                if name != 'lo':
+                    return name
+            return None
+        except Exception as e:
+            logging.warning(f"NetworkManager D-Bus query failed: {e}")
     result = subprocess.run(["nmcli", "-t", "-f", "ACTIVE,NAME", "connection", "show", "--active"], capture_output=True, text=True)
     for line in result.stdout.splitlines():
         active, name = line.split(':')
-        if active == "yes":
+        if active == "yes" and name != 'lo':
             return name
     return None
 
@@ -190,17 +343,20 @@ application_menu = [f"Companion {companion_version}", f"Satellite {satellite_ver
 
 # Function to switch network profile
 def switch_network_profile(new_profile):
+    get_active_connection.cache_clear()
     active_profile = get_active_connection()
     if active_profile != new_profile:
-        if active_profile:
-            subprocess.run(["sudo", "nmcli", "connection", "down", active_profile])
-        subprocess.run(["sudo", "nmcli", "connection", "up", new_profile], capture_output=True, text=True)
-        subprocess.run(["sudo", "nmcli", "device", "reapply"], capture_output=True, text=True)
-        active_profile = get_active_connection()
-        if active_profile == new_profile:
+        # Activating a profile deactivates whatever conflicts with it on the
+        # same device, so the explicit down/reapply forks are unnecessary and
+        # the interface never sits in a no-network gap between them
+        result = subprocess.run(["sudo", "nmcli", "connection", "up", new_profile],
+                                capture_output=True, text=True)
+        get_active_connection.cache_clear()
+        get_eth_profile.cache_clear()
+        if result.returncode == 0:
             logging.info(f"Successfully switched to {new_profile} profile")
         else:
-            logging.info(f"Failed to switch to {new_profile} profile")
+            logging.info(f"Failed to switch to {new_profile} profile: {result.stderr.strip()}")
 
 def initial_setup():
     state = load_state()
@@ -223,6 +379,9 @@ def initial_setup():
         switch_network_profile(STATIC_PROFILE)
 
 def toggle_service(service=None):
+    # Clear before so the stop-check below sees fresh state, and again after
+    # so the next frame doesn't serve the pre-toggle answer for up to 5 s
+    systemctl_is_active.cache_clear()
     state = load_state()
     if service:
         state["service"] = service
@@ -236,9 +395,13 @@ def toggle_service(service=None):
         if is_service_active("companion.service"):
             execute_command(command_stop_companion)
         execute_command(command_start_satellite)
+    systemctl_is_active.cache_clear()
     save_state(state)
 
 def toggle_network(network=None):
+    get_active_connection.cache_clear()
+    get_current_network_settings.cache_clear()
+    get_eth_profile.cache_clear()
     state = load_state()
     if network:
         state["network"] = network
@@ -263,30 +426,161 @@ BORDER = 5
 # Display Refresh
 LOOPTIME = 0.5  # Refresh rate reduced to 0.5 seconds
 
-# Use for I2C.
-i2c = board.I2C()
-oled = adafruit_ssd1306.SSD1306_I2C(WIDTH, HEIGHT, i2c, addr=0x3C, reset=oled_reset)
+# SSD1306 driver with a batched framebuffer path. The stock show() re-sends
+# the column/page address window before every transfer; we program horizontal
+# addressing over the full panel once at init so fast_show() can push the
+# whole 1024-byte framebuffer in a single I2C transaction.
+class FastSSD1306(adafruit_ssd1306.SSD1306_I2C):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Horizontal addressing over the full panel, set in one transaction
+        self.write_cmds(0x20, 0x00,
+                        0x21, 0, self.width - 1,
+                        0x22, 0, self.height // 8 - 1)
+        # The panel is mounted upside-down: invert segment remap and COM
+        # scan direction so the controller rotates the image itself and no
+        # software flip is needed per frame
+        self.write_cmds(0xA0, 0xC0)
+        self._prev_buf = None
+        self._packed = None
+        # Reusable transfer buffer for windowed writes (0x40 data prefix)
+        self._tx_buf = bytearray(1 + (self.height // 8) * self.width)
+        self._tx_buf[0] = 0x40
+
+    def write_cmds(self, *cmds):
+        # Batch several command bytes under a single 0x00 control byte
+        # instead of one I2C transaction per command
+        with self.i2c_device:
+            self.i2c_device.write(bytes((0x00,) + cmds))
+
+    def fill(self, value):
+        # Bypassed image(): the packed mirror is stale, make fast_show
+        # re-read the driver buffer
+        super().fill(value)
+        self._packed = None
+
+    def image(self, img):
+        # Pack the PIL 1-bit image into the SSD1306 page layout (one byte =
+        # 8 vertical pixels, LSB on top) with numpy instead of the base
+        # driver's per-pixel Python loop over all 8192 pixels.
+        arr = np.asarray(img, dtype=np.uint8)
+        pages = self.height // 8
+        packed = np.packbits(
+            arr.reshape(pages, 8, self.width).transpose(0, 2, 1)[:, :, ::-1],
+            axis=2,
+        )
+        # Write into the driver buffer in place rather than via bytes(), and
+        # keep the packed array so fast_show can diff without another copy
+        packed = packed.reshape(pages, self.width)
+        view = np.frombuffer(self.buffer, dtype=np.uint8, count=packed.size, offset=1)
+        view.reshape(pages, self.width)[:] = packed
+        self._packed = packed
+
+    def fast_show(self):
+        # Diff against the previously transmitted framebuffer and only send
+        # the page/column window that actually changed.
+        width = self.width
+        pages = self.height // 8
+        if self._packed is not None:
+            current = self._packed
+        else:
+            current = np.frombuffer(bytes(self.buffer[1:]), dtype=np.uint8).reshape(pages, width)
+        prev = self._prev_buf
+        if prev is None:
+            self.write_framebuf()
+            self._prev_buf = current
+            return
+        diff = current != prev
+        dirty_pages = np.flatnonzero(diff.any(axis=1))
+        if dirty_pages.size == 0:
+            return
+        page_start, page_end = int(dirty_pages[0]), int(dirty_pages[-1])
+        dirty_cols = np.flatnonzero(diff[page_start:page_end + 1].any(axis=0))
+        col_start, col_end = int(dirty_cols[0]), int(dirty_cols[-1])
+        window = (page_end - page_start + 1) * (col_end - col_start + 1)
+        if window > 0.6 * pages * width:
+            # Most of the frame changed; the windowed write would just add
+            # addressing overhead, so push the whole framebuffer
+            self.write_cmds(0x22, 0, pages - 1, 0x21, 0, width - 1)
+            self.write_framebuf()
+        else:
+            self.write_cmds(0x22, page_start, page_end, 0x21, col_start, col_end)
+            sub = current[page_start:page_end + 1, col_start:col_end + 1]
+            count = sub.size
+            np.frombuffer(self._tx_buf, dtype=np.uint8, count=count, offset=1)[:] = sub.ravel()
+            with self.i2c_device:
+                self.i2c_device.write(memoryview(self._tx_buf)[:1 + count])
+        self._prev_buf = current
+
+# Use for I2C. 400 kHz is the SSD1306 datasheet maximum and quarters the
+# per-frame bus time vs the 100 kHz default. The kernel bus clock must match:
+# add dtparam=i2c_arm_baudrate=400000 to /boot/firmware/config.txt.
+i2c = busio.I2C(board.SCL, board.SDA, frequency=400_000)
+oled = FastSSD1306(WIDTH, HEIGHT, i2c, addr=0x3C, reset=oled_reset)
 
 # Clear display.
 oled.fill(0)
 oled.show()
 
-# Create blank image for drawing.
-image = Image.new("1", (oled.width, oled.height))
+# Persistent framebuffer image, reused across frames instead of allocating
+# a new PIL image on every refresh.
+frame_image = Image.new("1", (oled.width, oled.height))
 
 # Get drawing object to draw on image.
-draw = ImageDraw.Draw(image)
-
-# Draw a white background
-draw.rectangle((0, 0, oled.width, oled.height), outline=255, fill=255)
-
-# Load fonts
-font10 = ImageFont.truetype('DejaVuSans.ttf', 10)
-font11 = ImageFont.truetype('DejaVuSans.ttf', 11)
-font12 = ImageFont.truetype('DejaVuSans.ttf', 12)
-font13 = ImageFont.truetype('DejaVuSans.ttf', 13)
-font14 = ImageFont.truetype('DejaVuSans.ttf', 14)
-font15 = ImageFont.truetype('DejaVuSans.ttf', 15)
+frame_draw = ImageDraw.Draw(frame_image)
+
+# Menu strings repeat frame after frame; cache their measured size so
+# FreeType layout runs once per distinct (font, text) pair. getbbox also
+# replaces the deprecated textsize.
+@lru_cache(maxsize=256)
+def _text_size(font, text):
+    bbox = font.getbbox(text)
+    return bbox[2], bbox[3]
+
+# Centered-header x offsets; getlength is the width-only fast path that
+# skips the bitmap step of a full bbox measurement
+@lru_cache(maxsize=128)
+def _centered_x(font, text):
+    return (oled.width - int(font.getlength(text))) // 2
+
+# Load fonts on demand; each size parses the TTF once and is cached forever.
+# Latin-only menus never need complex shaping; the BASIC layout engine
+# skips Raqm entirely when Pillow was built with it
+@lru_cache(maxsize=None)
+def load_font(size):
+    return ImageFont.truetype('DejaVuSans.ttf', size, layout_engine=ImageFont.Layout.BASIC)
+
+# The two sizes every screen uses
+font11 = load_font(11)
+font12 = load_font(12)
+
+# Warm FreeType's glyph cache for the menu fonts so the first paint of
+# dynamic text (IP octets, clock digits) never hits a cold shaper
+for _ch in string.printable:
+    font11.getmask(_ch)
+    font12.getmask(_ch)
+
+
+# Pre-rasterized text tiles: FreeType shapes and rasterizes each distinct
+# (font, text) pair once; later frames paste the cached bitmap, which is a
+# memcpy-class operation instead of a full layout + render pass.
+_text_tiles = {}
+
+def _text_tile(font, text):
+    key = (id(font), text)
+    tile = _text_tiles.get(key)
+    if tile is None:
+        if len(_text_tiles) > 1024:  # Bound growth from per-second clock strings
+            _text_tiles.clear()
+        width, height = _text_size(font, text)
+        tile = Image.new("1", (max(width, 1), max(height, 1)))
+        ImageDraw.Draw(tile).text((0, 0), text, font=font, fill=255)
+        _text_tiles[key] = tile
+    return tile
+
+def draw_text(image, xy, text, font):
+    if text:
+        image.paste(_text_tile(font, text), (int(xy[0]), int(xy[1])))
 
 # Global variables for menu navigation
 menu_state = "default"
@@ -303,15 +597,51 @@ original_subnet_mask = subnet_mask[:]
 original_gateway = gateway[:]
 
 blink_state = True
-last_interaction_time = time.time()
+last_interaction_time = time.monotonic()
 timeout_flag = False
-update_flag = True
-debounce_time = 0.05  # Debounce time for button presses
-last_update_time = time.time()  # Initialize the last update time
 
 # Global flag to indicate message display
 message_displayed = False
 
+# Signature of the last rendered frame; unchanged inputs skip the redraw
+_last_render_key = None
+
+# States whose content changes with the clock and need a periodic repaint
+# Button handlers test menu_state against these groups on every press;
+# frozensets make each check one hash probe instead of a list scan
+_INFO_STATES = frozenset(("show_network_info", "show_pi_health"))
+_EDIT_STATES = frozenset(("set_static_ip", "set_static_sm", "set_static_gw", "set_date", "set_time"))
+_OCTET_STATES = frozenset(("set_static_ip", "set_static_sm", "set_static_gw"))
+_DATETIME_STATES = frozenset(("set_date", "set_time"))
+_CONFIRM_STATES = frozenset(("update_confirm", "downgrade_confirm"))
+
+# Menus whose pixels are fully determined by the render signature; their
+# composed frames are kept so revisiting one is a plain buffer push.
+# Screens with external inputs (active network, service state, clock) are
+# deliberately absent.
+_FRAME_CACHE_STATES = frozenset((
+    "main", "configuration", "power", "set_static", "reboot_confirm",
+    "shutdown_confirm", "update", "update_confirm", "downgrade_confirm",
+    "app_updates", "update_companion", "update_satellite",
+    "app_update_companion", "app_update_satellite",
+))
+_frame_cache = OrderedDict()
+_FRAME_CACHE_CAP = 32
+
+# Update screens that render a centered header on row 0 and indicator rows below
+_CENTERED_HEADER_STATES = (
+    "app_updates",
+    "update_companion",
+    "update_satellite",
+    "app_update_companion",
+    "app_update_satellite",
+)
+
+_TICK_STATES = ("default", "show_network_info", "show_pi_health", "set_datetime", "application")
+
+# States that blink the selected field and repaint on every tick
+_BLINK_STATES = ("set_static_ip", "set_static_sm", "set_static_gw", "set_date", "set_time")
+
 # Menu options
 main_menu = ["APPLICATION", "CONFIGURATION", "POWER", "EXIT"]
 application_menu = ["RUN COMPANION", "RUN SATELLITE", "UPDATE APPS", "EXIT"]
@@ -355,138 +685,266 @@ menu_options = {
 }
 
 # Button indicators
-indicators = {
-    "K1": "▲",
-    "K2": "▼",
-    "K3": "◀",
-    "K4": "▶"
-}
+# Indexed by row: K1..K4 top to bottom
+indicators = ("▲", "▼", "◀", "▶")
+
+# Positioned line lists for plain menus, computed once per (state, options,
+# network selection) combination at state-transition time rather than per
+# frame. Entries are ((x, y), text) pairs drawn with font11.
+# Octets only span 0-255; format the zero-padded strings once instead of
+# per blink frame on the address editors
+_OCT = tuple(f"{i:03}" for i in range(256))
+
+_menu_spec_cache = {}
+
+def _menu_spec(state_name, options, active_network):
+    key = (state_name, tuple(options), active_network)
+    spec = _menu_spec_cache.get(key)
+    if spec is None:
+        spec = []
+        for i, option in enumerate(options):
+            if not option:
+                continue
+            prefix = ""
+            if state_name == "network" and (
+                (option == "DHCP" and active_network == DHCP_PROFILE)
+                or (option == "STATIC IP" and active_network == STATIC_PROFILE)
+            ):
+                prefix = "*"
+            spec.append(((0, i * 16), prefix + option))
+            suffix = indicators[i]
+            if suffix:
+                spec.append(((112, i * 16), suffix))
+        _menu_spec_cache[key] = spec
+    return spec
+
+# Warm the tile cache for every static menu string so first paint is cheap
+for _options in menu_options.values():
+    for _option in _options:
+        if _option:
+            _text_tile(font11, _option)
+for _indicator in indicators:
+    _text_tile(font11, _indicator)
+
+def _default_gateway():
+    # /proc/net/route lists the gateway as little-endian hex; the default
+    # route has destination 00000000
+    try:
+        with open('/proc/net/route') as f:
+            next(f)
+            for line in f:
+                fields = line.split()
+                if fields[1] == '00000000' and int(fields[3], 16) & 2:
+                    return socket.inet_ntoa(bytes.fromhex(fields[2])[::-1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return "N/A"
+
+def _first_nameserver():
+    try:
+        with open('/etc/resolv.conf') as f:
+            for line in f:
+                if line.startswith('nameserver'):
+                    return line.split()[1]
+    except (OSError, IndexError):
+        pass
+    return "N/A"
 
 # Function to get current network settings
+@ttl_cache(seconds=5)
 def get_current_network_settings():
-    ip = subprocess.check_output(["hostname", "-I"]).decode('utf-8').strip().split()[0]
-    subnet = subprocess.check_output(["ip", "-o", "-f", "inet", "addr", "show"]).decode('utf-8')
-    subnet = [line.split()[3] for line in subnet.splitlines() if 'eth0' in line]
-    subnet = subnet[0].split('/')[1] if subnet else "N/A"
-    subnet = cidr_to_subnet_mask(subnet)
-    gateway = subprocess.check_output(["ip", "route", "show", "default"]).decode('utf-8').split()[2]
-    dns = subprocess.check_output(["nmcli", "dev", "show"]).decode('utf-8')
-    dns_servers = [line.split(':')[-1].strip() for line in dns.splitlines() if 'IP4.DNS' in line]
-    dns = dns_servers[0] if dns_servers else "N/A"
-    return ip, subnet, gateway, dns
+    ip, subnet = "N/A", "N/A"
+    for addr in psutil.net_if_addrs().get('eth0', []):
+        if addr.family == socket.AF_INET:
+            ip = addr.address
+            subnet = addr.netmask or "N/A"
+            break
+    return ip, subnet, _default_gateway(), _first_nameserver()
 
 # FUNCTION TO UPDATE COMMAND WITH PROGRESS
-def execute_command_with_progress(command):
+def execute_command_with_progress(command, input_text=None):
+    # Child I/O runs on a pump thread so a child that stops flushing can't
+    # stall drawing; this thread just repaints the latest percentage at 10 Hz.
     try:
-        process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-        for line in iter(process.stdout.readline, ''):
-            if line == '':
-                break
-            logging.debug(f"Command output: {line.strip()}")
-            # Parse the line for progress percentage
-            progress = parse_progress(line)
-            if progress is not None:
-                # Update OLED display with progress
+        process = subprocess.Popen(command, stdin=subprocess.PIPE if input_text else None,
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        if input_text:
+            # Feed the updater's menu answer directly instead of piping echo
+            # through a shell
+            process.stdin.write(input_text)
+            process.stdin.close()
+        latest = [None]
+
+        def _pump():
+            for line in iter(process.stdout.readline, ''):
+                logging.debug("Command output: %s", line.strip())
+                # Most lines carry no percentage
+                if '%' not in line:
+                    continue
+                progress = parse_progress(line)
+                if progress is not None:
+                    latest[0] = progress
+            process.stdout.close()
+
+        pump = threading.Thread(target=_pump, daemon=True)
+        pump.start()
+
+        last_progress = -1
+        while process.poll() is None or pump.is_alive():
+            progress = latest[0]
+            if progress is not None and progress != last_progress:
                 update_oled_with_progress(progress)
-        process.stdout.close()
+                last_progress = progress
+            time.sleep(0.1)
+        # The child can exit between polls; paint the final percentage so the
+        # screen doesn't end short of the last value parsed (typically 100%)
+        progress = latest[0]
+        if progress is not None and progress != last_progress:
+            update_oled_with_progress(progress)
         process.wait()
     except Exception as e:
         logging.error(f"Error executing command with progress: {e}")
 
 # PARSE PROGRESS
 def parse_progress(output_line):
-    # Use regex to search for percentage
-    match = re.search(r'(\d+)%', output_line)
-    if match:
-        progress = int(match.group(1))
-        return progress
-    else:
+    # Walk back from the '%' collecting digits; cheaper than a regex on the
+    # thousands of lines an install emits
+    end = output_line.find('%')
+    if end <= 0:
         return None
+    start = end
+    while start > 0 and output_line[start - 1].isdigit():
+        start -= 1
+    if start == end:
+        return None
+    return int(output_line[start:end])
 
 # UPDATE OLED FUNCTION
+# Only 101 distinct progress screens exist; keep each one after its first
+# composition so repeats during an install are a plain buffer push
+_progress_frames = {}
+
 def update_oled_with_progress(progress):
+    with frame_lock:
+        frame = _progress_frames.get(progress)
+        if frame is None:
+            clear_display()
+            local_image = frame_image
+            local_draw = frame_draw
+
+            # Display progress percentage
+            draw_text(local_image, (30, 0), "UPDATING", font12)
+            draw_text(local_image, (10, 16), "DO NOT TURN OFF", font12)
+            draw_text(local_image, (0, 32), f"Progress: {progress}%", font12)
+
+            # Draw a progress bar
+            bar_width = int((progress / 100) * (oled.width - 20))
+            local_draw.rectangle((10, 50, 10 + bar_width, 58), outline=255, fill=255)
+
+            frame = local_image.copy()
+            _progress_frames[progress] = frame
+        oled.image(frame)
     with oled_lock:
-        # Create a new image to display
-        local_image = Image.new("1", (oled.width, oled.height))
-        local_draw = ImageDraw.Draw(local_image)
+        oled.fast_show()
 
-        # Display progress percentage
-        local_draw.text((30, 0), f"UPDATING", font=font12, fill=255)
-        local_draw.text((10, 16), f"DO NOT TURN OFF", font=font12, fill=255)
-        local_draw.text((0, 32), f"Progress: {progress}%", font=font12, fill=255)
-
-        # Draw a progress bar
-        bar_width = int((progress / 100) * (oled.width - 20))
-        local_draw.rectangle((10, 50, 10 + bar_width, 58), outline=255, fill=255)
-
-        oled.image(local_image.rotate(180))
-        oled.show()
+def get_primary_ip():
+    try:
+        for nic, addrs in psutil.net_if_addrs().items():
+            if nic == 'lo':
+                continue
+            for addr in addrs:
+                if addr.family == socket.AF_INET:
+                    return addr.address
+    except Exception as e:
+        logging.error(f"Error reading interface addresses: {e}")
+    return ""
 
-def cidr_to_subnet_mask(cidr):
-    cidr = int(cidr)
-    mask = (0xffffffff >> (32 - cidr)) << (32 - cidr)
-    return f'{(mask >> 24) & 0xff}.{(mask >> 16) & 0xff}.{(mask >> 8) & 0xff}.{mask & 0xff}'
+def get_cpu_temp():
+    try:
+        with open('/sys/class/thermal/thermal_zone0/temp') as f:
+            return f"{int(f.read()) / 1000:.1f}'C"
+    except (OSError, ValueError):
+        return ""
+
+# Active ethernet profile changes rarely; cache the nmcli lookup for 30s
+@ttl_cache(seconds=30)
+def get_eth_profile():
+    result = subprocess.run(["nmcli", "-t", "-f", "NAME,DEVICE", "connection", "show", "--active"], capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        name, _, device = line.partition(':')
+        if 'eth' in device:
+            return name
+    return ""
 
+@ttl_cache(seconds=5)
 def get_pi_health():
-    temp = subprocess.check_output(["vcgencmd", "measure_temp"]).decode('utf-8').strip().split('=')[1]
+    temp = get_cpu_temp()
+    # Core voltage has no stable sysfs node across Pi models; keep vcgencmd,
+    # amortized by this function's TTL cache
     voltage = subprocess.check_output(["vcgencmd", "measure_volts"]).decode('utf-8').strip().split('=')[1].replace('V', '')
-    cpu_usage = psutil.cpu_percent(interval=1)  # Using psutil for accurate CPU usage
-    memory = subprocess.check_output(["free", "-m"]).decode('utf-8')
-    memory = [line for line in memory.split('\n') if "Mem:" in line][0].split()
-    memory_used = int(memory[2]) / 1024
-    memory_total = int(memory[1]) / 1024
-    memory_percentage = (memory_used / memory_total) * 100
+    # Non-blocking: returns usage since the previous call (primed at startup)
+    cpu_usage = psutil.cpu_percent(interval=None)
+    memory = psutil.virtual_memory()
+    memory_used = (memory.total - memory.available) / (1024 ** 3)
+    memory_total = memory.total / (1024 ** 3)
     watt_input = float(voltage) * 0.85  # Assuming the current draw is approximately 0.85A
     return temp, voltage, watt_input, cpu_usage, f"{memory_used:.2f}/{memory_total:.2f}GB"
 
 # Function to clear the OLED display before drawing new content
 def clear_display():
     logging.debug("Clearing display")
-    draw.rectangle((0, 0, oled.width, oled.height), outline=0, fill=0)
+    frame_draw.rectangle((0, 0, oled.width, oled.height), outline=0, fill=0)
 
 # Function to update OLED display
 def update_oled_display():
-    global blink_state, gateway, update_flag, last_update_time, datetime_temp, time_format_24hr, message_displayed, selected_version
+    global blink_state, gateway, datetime_temp, time_format_24hr, message_displayed, selected_version
     global companion_version, satellite_version  # Declare as global to modify them
-    current_time = time.time()
+    global _last_render_key
     if message_displayed or updating_application:
         return
-    if not update_flag or (current_time - last_update_time) < LOOPTIME:
+
+    # Short-circuit when none of the inputs that shape this screen changed
+    render_key = (menu_state, menu_selection, ip_octet, tuple(ip_address),
+                  tuple(subnet_mask), tuple(gateway), time_format_24hr, selected_version)
+    if menu_state in _TICK_STATES:
+        render_key += (int(time.time()),)
+    elif menu_state in _BLINK_STATES:
+        render_key += (blink_state, datetime_temp)
+    if render_key == _last_render_key:
         return
-    update_flag = False
-    last_update_time = current_time
     logging.debug("Updating OLED display")
 
-    with oled_lock:
-        local_image = Image.new("1", (oled.width, oled.height))
-        local_draw = ImageDraw.Draw(local_image)
-
-        state = load_state()
+    cached = _frame_cache.get(render_key) if menu_state in _FRAME_CACHE_STATES else None
+    if cached is not None:
+        _frame_cache.move_to_end(render_key)
+        with frame_lock:
+            oled.image(cached)
+        with oled_lock:
+            oled.fast_show()
+        _last_render_key = render_key
+        return
 
+    with frame_lock:
         clear_display()
+        local_image = frame_image
+        # Local aliases: the branches below hit these dozens of times per
+        # frame, and LOAD_FAST is cheaper than LOAD_GLOBAL per access
+        _draw = draw_text
+        _f11 = font11
+        _f12 = font12
+        _ind = indicators
 
         if menu_state == "default":
             current_time_format = "%H:%M:%S" if time_format_24hr else "%I:%M:%S %p"
             current_time_str = datetime.now().strftime(current_time_format)
-            # Shell scripts for system monitoring
-            cmd = "hostname -I | cut -d\' \' -f1"
-            IP = subprocess.check_output(cmd, shell=True).decode('utf-8').strip()
-            cmd = "top -bn1 | grep load | awk '{printf \"CPU: %.2f\", $(NF-2)}'"
-            CPU = subprocess.check_output(cmd, shell=True).decode('utf-8').strip()
-            cmd = "free -m | awk 'NR==2{printf \"Mem: %s/%sMB %.2f%%\", $3,$2,$3*100/$2 }'"
-            MemUsage = subprocess.check_output(cmd, shell=True).decode('utf-8').strip()
-            cmd = "df -h | awk '$NF==\"/\"{printf \"Disk: %d/%dGB %s\", $3,$2,$5}'"
-            Disk = subprocess.check_output(cmd, shell=True).decode('utf-8').strip()
-            cmd = "vcgencmd measure_temp |cut -f 2 -d '='"
-            Temp = subprocess.check_output(cmd, shell=True).decode('utf-8').strip()
-
-            # Get the active ethernet connection profile name
-            cmd = "nmcli -t -f NAME,DEVICE connection show --active | grep eth | cut -d':' -f1"
-            EthProfile = subprocess.check_output(cmd, shell=True).decode('utf-8').strip()
+            # Native reads instead of shelled-out pipelines
+            IP = get_primary_ip()
+            Temp = get_cpu_temp()
+            EthProfile = get_eth_profile()
 
             # Check the status of the services
-            companion_active = subprocess.run(["systemctl", "is-active", "--quiet", "companion.service"]).returncode == 0
-            satellite_active = subprocess.run(["systemctl", "is-active", "--quiet", "satellite.service"]).returncode == 0
+            companion_active = is_service_active("companion.service")
+            satellite_active = is_service_active("satellite.service")
 
             if companion_active:
                 title = "COMPANION"
@@ -498,18 +956,15 @@ def update_oled_display():
                 title = "SYSTEM OFF"
                 port = ""
 
-            # Center the title text
-            title_bbox = local_draw.textbbox((0, 0), title, font=font14)
-            title_x = (oled.width - (title_bbox[2] - title_bbox[0])) // 2
 
             # Pi Stats Display
-            local_draw.text((0, 0), f"{title}", font=font12, fill=255)
-            local_draw.text((90, 0), EthProfile, font=font11, fill=255)
-            local_draw.text((0, 16), IP, font=font11, fill=255)
-            local_draw.text((95, 16), port, font=font11, fill=255)
-            local_draw.text((0, 32), f"{current_time_str}", font=font12, fill=255)
-            local_draw.text((90, 32), Temp, font=font11, fill=255)
-            local_draw.text((0, 48), "omniconpro.com / help", font=font11, fill=255)
+            _draw(local_image, (0, 0), f"{title}", _f12)
+            _draw(local_image, (90, 0), EthProfile, _f11)
+            _draw(local_image, (0, 16), IP, _f11)
+            _draw(local_image, (95, 16), port, _f11)
+            _draw(local_image, (0, 32), f"{current_time_str}", _f12)
+            _draw(local_image, (90, 32), Temp, _f11)
+            _draw(local_image, (0, 48), "omniconpro.com / help", _f11)
 
         elif menu_state == "application":
             # Refresh versions
@@ -528,57 +983,57 @@ def update_oled_display():
                         prefix = "*"
                     elif option.startswith("Satellite") and is_service_active("satellite.service"):
                         prefix = "*"
-                    suffix = indicators.get(f"K{i+1}", "")  # Use .get to avoid KeyError
-                    local_draw.text((0, i * 16), f"{prefix}{option}", font=font11, fill=255)
-                    local_draw.text((112, i * 16), suffix, font=font11, fill=255)
+                    suffix = _ind[i]
+                    _draw(local_image, (0, i * 16), prefix + option if prefix else option, _f11)
+                    _draw(local_image, (112, i * 16), suffix, _f11)
 
         elif menu_state == "set_static_ip":
-            ip_display = [f"{ip:03}" for ip in ip_address]
+            ip_display = [_OCT[ip] for ip in ip_address]
             if blink_state:
                 ip_display[ip_octet] = f"[{ip_display[ip_octet]}]"  # Highlight the selected octet with brackets
             else:
                 ip_display[ip_octet] = f" {ip_display[ip_octet]} "  # Remove brackets during blink off
-            local_draw.text((0, 0), "   SET IP ADDRESS", font=font12, fill=255)
-            local_draw.text((0, 16), ' '.join(ip_display), font=font12, fill=255)
-            local_draw.text((0, 32), "CANCEL : 1 SECOND  ◀", font=font11, fill=255)
-            local_draw.text((0, 48), "APPLY :    1 SECOND  ▶", font=font11, fill=255)
+            _draw(local_image, (0, 0), "   SET IP ADDRESS", _f12)
+            _draw(local_image, (0, 16), ' '.join(ip_display), _f12)
+            _draw(local_image, (0, 32), "CANCEL : 1 SECOND  ◀", _f11)
+            _draw(local_image, (0, 48), "APPLY :    1 SECOND  ▶", _f11)
 
         elif menu_state == "set_static_sm":
-            sm_display = [f"{sm:03}" for sm in subnet_mask]
+            sm_display = [_OCT[sm] for sm in subnet_mask]
             if blink_state:
                 sm_display[ip_octet] = f"[{sm_display[ip_octet]}]"  # Highlight the selected octet with brackets
             else:
                 sm_display[ip_octet] = f" {sm_display[ip_octet]} "  # Remove brackets during blink off
-            local_draw.text((0, 0), "  SET SUBNET MASK", font=font12, fill=255)
-            local_draw.text((0, 16), ' '.join(sm_display), font=font12, fill=255)
-            local_draw.text((0, 32), "CANCEL : 1 SECOND  ◀", font=font11, fill=255)
-            local_draw.text((0, 48), "APPLY :    1 SECOND  ▶", font=font11, fill=255)
+            _draw(local_image, (0, 0), "  SET SUBNET MASK", _f12)
+            _draw(local_image, (0, 16), ' '.join(sm_display), _f12)
+            _draw(local_image, (0, 32), "CANCEL : 1 SECOND  ◀", _f11)
+            _draw(local_image, (0, 48), "APPLY :    1 SECOND  ▶", _f11)
 
         elif menu_state == "set_static_gw":
-            gw_display = [f"{gw:03}" for gw in gateway]
+            gw_display = [_OCT[gw] for gw in gateway]
             if blink_state:
                 gw_display[ip_octet] = f"[{gw_display[ip_octet]}]"  # Highlight the selected octet with brackets
             else:
                 gw_display[ip_octet] = f" {gw_display[ip_octet]} "  # Remove brackets during blink off
-            local_draw.text((0, 0), "     SET GATEWAY", font=font12, fill=255)
-            local_draw.text((0, 16), ' '.join(gw_display), font=font12, fill=255)
-            local_draw.text((0, 32), "CANCEL : 1 SECOND  ◀", font=font11, fill=255)
-            local_draw.text((0, 48), "APPLY :    1 SECOND  ▶", font=font11, fill=255)
+            _draw(local_image, (0, 0), "     SET GATEWAY", _f12)
+            _draw(local_image, (0, 16), ' '.join(gw_display), _f12)
+            _draw(local_image, (0, 32), "CANCEL : 1 SECOND  ◀", _f11)
+            _draw(local_image, (0, 48), "APPLY :    1 SECOND  ▶", _f11)
 
         elif menu_state == "show_network_info":
             ip, subnet, gateway_addr, dns = get_current_network_settings()
-            local_draw.text((0, 0), f"IP: {ip}", font=font11, fill=255)
-            local_draw.text((0, 16), f"SUB: {subnet}", font=font11, fill=255)
-            local_draw.text((0, 32), f"GW: {gateway_addr}", font=font11, fill=255)
-            local_draw.text((0, 48), f"DNS: {dns}", font=font11, fill=255)
+            _draw(local_image, (0, 0), f"IP: {ip}", _f11)
+            _draw(local_image, (0, 16), f"SUB: {subnet}", _f11)
+            _draw(local_image, (0, 32), f"GW: {gateway_addr}", _f11)
+            _draw(local_image, (0, 48), f"DNS: {dns}", _f11)
 
         elif menu_state == "show_pi_health":
             temp, voltage, watt_input, cpu, memory = get_pi_health()
             current_datetime = datetime.now().strftime("%m/%d/%y  %H:%M" if time_format_24hr else "%m/%d/%y  %I:%M %p")
-            local_draw.text((0, 0), f" {current_datetime}", font=font12, fill=255)
-            local_draw.text((12, 16), f"RAM: {memory}", font=font11, fill=255)
-            local_draw.text((11, 32), f"V: {voltage}   W: {watt_input:.2f}", font=font11, fill=255)
-            local_draw.text((39, 48), f"CPU: {cpu:.2f}%", font=font11, fill=255)
+            _draw(local_image, (0, 0), f" {current_datetime}", _f12)
+            _draw(local_image, (12, 16), f"RAM: {memory}", _f11)
+            _draw(local_image, (11, 32), f"V: {voltage}   W: {watt_input:.2f}", _f11)
+            _draw(local_image, (39, 48), f"CPU: {cpu:.2f}%", _f11)
 
         elif menu_state == "set_date":
             date_display = datetime_temp.strftime("%m/%d/%y")
@@ -591,10 +1046,10 @@ def update_oled_display():
                     date_display = f"{date_display[:6]}[{date_display[6:]}]"
             else:
                 date_display = datetime_temp.strftime("%m/%d/%y")
-            local_draw.text((0, 0), "          SET DATE", font=font12, fill=255)
-            local_draw.text((35, 16), date_display, font=font12, fill=255)
-            local_draw.text((0, 32), "CANCEL : 1 SECOND  ◀", font=font11, fill=255)
-            local_draw.text((0, 48), "APPLY :    1 SECOND  ▶", font=font11, fill=255)
+            _draw(local_image, (0, 0), "          SET DATE", _f12)
+            _draw(local_image, (35, 16), date_display, _f12)
+            _draw(local_image, (0, 32), "CANCEL : 1 SECOND  ◀", _f11)
+            _draw(local_image, (0, 48), "APPLY :    1 SECOND  ▶", _f11)
 
         elif menu_state == "set_time":
             time_format_display = "24hr" if time_format_24hr else "12hr"
@@ -615,40 +1070,40 @@ def update_oled_display():
                 time_display = datetime_temp.strftime("%H:%M" if time_format_24hr else "%I:%M")
                 am_pm_display = datetime_temp.strftime("%p") if not time_format_24hr else ""
 
-            local_draw.text((0, 0), "          SET TIME", font=font12, fill=255)
-            local_draw.text((0, 16), f"{time_format_display} - {time_display} {am_pm_display}", font=font12, fill=255)
-            local_draw.text((0, 32), "CANCEL : 1 SECOND  ◀", font=font11, fill=255)
-            local_draw.text((0, 48), "APPLY :    1 SECOND  ▶", font=font11, fill=255)
+            _draw(local_image, (0, 0), "          SET TIME", _f12)
+            _draw(local_image, (0, 16), f"{time_format_display} - {time_display} {am_pm_display}", _f12)
+            _draw(local_image, (0, 32), "CANCEL : 1 SECOND  ◀", _f11)
+            _draw(local_image, (0, 48), "APPLY :    1 SECOND  ▶", _f11)
 
         elif menu_state == "set_datetime":
             current_datetime = datetime.now().strftime("%m/%d/%y   %H:%M" if time_format_24hr else "%m/%d/%y   %I:%M %p")
-            local_draw.text((0, 0), f"{current_datetime}", font=font12, fill=255)
-            local_draw.text((0, 16), "SET DATE", font=font12, fill=255)
-            local_draw.text((0, 32), "SET TIME", font=font12, fill=255)
-            local_draw.text((0, 48), "EXIT", font=font12, fill=255)
-            local_draw.text((112, 16), indicators["K2"], font=font11, fill=255)  # Down button for SET DATE
-            local_draw.text((112, 32), indicators["K3"], font=font11, fill=255)  # Left button for SET TIME
-            local_draw.text((112, 48), indicators["K4"], font=font11, fill=255)  # Right button for EXIT
+            _draw(local_image, (0, 0), f"{current_datetime}", _f12)
+            _draw(local_image, (0, 16), "SET DATE", _f12)
+            _draw(local_image, (0, 32), "SET TIME", _f12)
+            _draw(local_image, (0, 48), "EXIT", _f12)
+            _draw(local_image, (112, 16), _ind[1], _f11)  # Down button for SET DATE
+            _draw(local_image, (112, 32), _ind[2], _f11)  # Left button for SET TIME
+            _draw(local_image, (112, 48), _ind[3], _f11)  # Right button for EXIT
 
         elif menu_state == "update":
             for i, option in enumerate(update_menu):
                 if option:
-                    suffix = indicators.get(f"K{i+1}", "")  # Use .get to avoid KeyError
-                    local_draw.text((0, i * 16), option, font=font11, fill=255)
+                    suffix = _ind[i]
+                    _draw(local_image, (0, i * 16), option, _f11)
                     if i > 0:  # Skip the indicator for the first line
-                        local_draw.text((112, i * 16), suffix, font=font11, fill=255)
+                        _draw(local_image, (112, i * 16), suffix, _f11)
 
         elif menu_state == "update_confirm":
             if selected_version is None:
                 display_version = "Unknown"
             else:
                 display_version = selected_version
-            local_draw.text((0, 0), f"CURRENT: {current_version}", font=font11, fill=255)
-            local_draw.text((0, 16), f"AVAILABLE: {display_version}", font=font11, fill=255)
-            local_draw.text((0, 32), "CANCEL", font=font11, fill=255)
-            local_draw.text((112, 32), indicators["K3"], font=font11, fill=255)
-            local_draw.text((0, 48), "APPLY", font=font11, fill=255)
-            local_draw.text((112, 48), indicators["K4"], font=font11, fill=255)
+            _draw(local_image, (0, 0), f"CURRENT: {current_version}", _f11)
+            _draw(local_image, (0, 16), f"AVAILABLE: {display_version}", _f11)
+            _draw(local_image, (0, 32), "CANCEL", _f11)
+            _draw(local_image, (112, 32), _ind[2], _f11)
+            _draw(local_image, (0, 48), "APPLY", _f11)
+            _draw(local_image, (112, 48), _ind[3], _f11)
 
 
         elif menu_state == "downgrade_confirm":
@@ -656,114 +1111,53 @@ def update_oled_display():
                 display_version = "Unknown"
             else:
                 display_version = selected_version
-            local_draw.text((0, 0), f"CURRENT: {current_version}", font=font11, fill=255)
-            local_draw.text((0, 16), f"AVAILABLE: {display_version}", font=font11, fill=255)
-            local_draw.text((0, 32), "CANCEL", font=font11, fill=255)
-            local_draw.text((112, 32), indicators["K3"], font=font11, fill=255)
-            local_draw.text((0, 48), "APPLY", font=font11, fill=255)
-            local_draw.text((112, 48), indicators["K4"], font=font11, fill=255)
+            _draw(local_image, (0, 0), f"CURRENT: {current_version}", _f11)
+            _draw(local_image, (0, 16), f"AVAILABLE: {display_version}", _f11)
+            _draw(local_image, (0, 32), "CANCEL", _f11)
+            _draw(local_image, (112, 32), _ind[2], _f11)
+            _draw(local_image, (0, 48), "APPLY", _f11)
+            _draw(local_image, (112, 48), _ind[3], _f11)
 
 
         elif menu_state in ["upgrade_select", "downgrade_select"]:
             for i, version in enumerate(available_versions[:3]):
-                suffix = indicators.get(f"K{i+1}", "")  # Use .get to avoid KeyError
-                local_draw.text((0, i * 16), version, font=font11, fill=255)
-                local_draw.text((112, i * 16), suffix, font=font11, fill=255)
-            local_draw.text((0, 48), "EXIT", font=font11, fill=255)
-            local_draw.text((112, 48), indicators["K4"], font=font11, fill=255)
-
-        elif menu_state == "app_updates":
-            options = menu_options[menu_state]
-            for i, option in enumerate(options):
-                if option:
-                    if i == 0:
-                        # Center the first line and remove the indicator
-                        text_width, text_height = local_draw.textsize(option, font=font11)
-                        x_position = (oled.width - text_width) // 2
-                        local_draw.text((x_position, i * 16), option, font=font11, fill=255)
-                    else:
-                        suffix = indicators.get(f"K{i+1}", "")
-                        local_draw.text((0, i * 16), option, font=font11, fill=255)
-                        local_draw.text((112, i * 16), suffix, font=font11, fill=255)
-
-        elif menu_state == "update_companion":
-            options = menu_options[menu_state]
-            for i, option in enumerate(options):
-                if option:
-                    if i == 0:
-                        # Center the text "UPDATE COMPANION" without indicator
-                        text_width, text_height = local_draw.textsize(option, font=font11)
-                        x_position = (oled.width - text_width) // 2
-                        local_draw.text((x_position, i * 16), option, font=font11, fill=255)
-                    else:
-                        # Show indicators on lines 2, 3, & 4
-                        suffix = indicators.get(f"K{i+1}", "")
-                        local_draw.text((0, i * 16), option, font=font11, fill=255)
-                        local_draw.text((112, i * 16), suffix, font=font11, fill=255)
+                suffix = _ind[i]
+                _draw(local_image, (0, i * 16), version, _f11)
+                _draw(local_image, (112, i * 16), suffix, _f11)
+            _draw(local_image, (0, 48), "EXIT", _f11)
+            _draw(local_image, (112, 48), _ind[3], _f11)
 
-        elif menu_state == "update_satellite":
+        elif menu_state in _CENTERED_HEADER_STATES:
             options = menu_options[menu_state]
             for i, option in enumerate(options):
                 if option:
                     if i == 0:
-                        # Center the text "UPDATE SATELLITE" without indicator
-                        text_width, text_height = local_draw.textsize(option, font=font11)
-                        x_position = (oled.width - text_width) // 2
-                        local_draw.text((x_position, i * 16), option, font=font11, fill=255)
+                        # Center the header line without a button indicator
+                        x_position = _centered_x(_f11, option)
+                        _draw(local_image, (x_position, i * 16), option, _f11)
                     else:
                         # Show indicators on lines 2, 3, & 4
-                        suffix = indicators.get(f"K{i+1}", "")
-                        local_draw.text((0, i * 16), option, font=font11, fill=255)
-                        local_draw.text((112, i * 16), suffix, font=font11, fill=255)
-
-        elif menu_state == "app_update_companion":
-            options = menu_options[menu_state]
-            for i, option in enumerate(options):
-                if option:
-                    if i == 0:
-                        # Center the text "UPDATE COMPANION" and remove button indicator
-                        text_width = local_draw.textsize(option, font=font11)[0]
-                        x = (oled.width - text_width) // 2
-                        local_draw.text((x, i * 16), option, font=font11, fill=255)
-                        # No button indicator
-                    else:
-                        suffix = indicators.get(f"K{i+1}", "")  # Use .get to avoid KeyError
-                        local_draw.text((0, i * 16), option, font=font11, fill=255)
-                        local_draw.text((112, i * 16), suffix, font=font11, fill=255)
-
-        elif menu_state == "app_update_satellite":
-            options = menu_options[menu_state]
-            for i, option in enumerate(options):
-                if option:
-                    if i == 0:
-                        # Center the text "UPDATE SATELLITE" and remove button indicator
-                        text_width = local_draw.textsize(option, font=font11)[0]
-                        x = (oled.width - text_width) // 2
-                        local_draw.text((x, i * 16), option, font=font11, fill=255)
-                        # No button indicator
-                    else:
-                        suffix = indicators.get(f"K{i+1}", "")  # Use .get to avoid KeyError
-                        local_draw.text((0, i * 16), option, font=font11, fill=255)
-                        local_draw.text((112, i * 16), suffix, font=font11, fill=255)
+                        suffix = _ind[i]
+                        _draw(local_image, (0, i * 16), option, _f11)
+                        _draw(local_image, (112, i * 16), suffix, _f11)
 
         else:
             options = menu_options.get(menu_state, [])
-            state = load_state()
-            for i, option in enumerate(options):
-                if option:
-                    prefix = ""
-                    if menu_state == "network":
-                        if (option == "DHCP" and state["network"] == DHCP_PROFILE) or (option == "STATIC IP" and state["network"] == STATIC_PROFILE):
-                            prefix = "*"
-                    suffix = indicators.get(f"K{i+1}", "")  # Use .get to avoid KeyError
-                    local_draw.text((0, i * 16), f"{prefix}{option}", font=font11, fill=255)
-                    local_draw.text((112, i * 16), suffix, font=font11, fill=255)
-
-        oled.image(local_image.rotate(180))
-        oled.show()
-        blink_state = not blink_state
-        update_flag = True
-        logging.debug("OLED display updated")
+            # Only the network menu needs the saved profile for its "*" mark
+            active_network = load_state()["network"] if menu_state == "network" else None
+            for xy, text in _menu_spec(menu_state, options, active_network):
+                _draw(local_image, xy, text, _f11)
+
+        if menu_state in _FRAME_CACHE_STATES:
+            _frame_cache[render_key] = local_image.copy()
+            if len(_frame_cache) > _FRAME_CACHE_CAP:
+                _frame_cache.popitem(last=False)
+        oled.image(local_image)
+    with oled_lock:
+        oled.fast_show()
+    blink_state = not blink_state
+    _last_render_key = render_key
+    logging.debug("OLED display updated")
 
 def reset_to_main():
     global menu_state, ip_address, subnet_mask, gateway, timeout_flag, datetime_temp
@@ -774,28 +1168,18 @@ def reset_to_main():
         subnet_mask = original_subnet_mask[:]
         gateway = original_gateway[:]
         datetime_temp = datetime.now()
-        update_oled_display()
+        display_dirty.set()
         timeout_flag = True
 
-# Debounce decorator for button event handlers
-def debounce(func):
-    def wrapper(*args, **kwargs):
-        current_time = time.time()
-        if current_time - wrapper.last_called >= debounce_time:
-            func(*args, **kwargs)
-            wrapper.last_called = current_time
-    wrapper.last_called = 0
-    return wrapper
-
-# Button event handlers with debounce
-@debounce
+# Button event handlers; debouncing happens at the LgpioButton edge layer
+# (bounce_time at construction), so no per-call wrapper is needed here
 def button_k1_pressed():
     global menu_state, menu_selection, ip_octet, last_interaction_time, timeout_flag, datetime_temp
     logging.debug("K1 pressed")
-    last_interaction_time = time.time()
+    last_interaction_time = time.monotonic()
     timeout_flag = False
 
-    if menu_state in ["show_network_info", "show_pi_health"]:
+    if menu_state in _INFO_STATES:
         reset_to_main()
     elif menu_state == "default":
         logging.debug("Switching from default to main menu via K1")
@@ -811,22 +1195,21 @@ def button_k1_pressed():
         update_date(1)
     elif menu_state == "set_time":
         update_time(1)
-    elif menu_state in ["update_confirm", "downgrade_confirm"]:
+    elif menu_state in _CONFIRM_STATES:
         # Do nothing on short press
         pass
     else:
         menu_selection = 0
         activate_menu_item()
-    update_oled_display()
+    display_dirty.set()
 
-@debounce
 def button_k2_pressed():
     global menu_state, menu_selection, ip_octet, last_interaction_time, timeout_flag, datetime_temp
     logging.debug("K2 pressed")
-    last_interaction_time = time.time()
+    last_interaction_time = time.monotonic()
     timeout_flag = False
 
-    if menu_state in ["show_network_info", "show_pi_health"]:
+    if menu_state in _INFO_STATES:
         reset_to_main()
     elif menu_state == "default":
         logging.debug("Switching from default to main menu via K2")
@@ -842,22 +1225,21 @@ def button_k2_pressed():
         update_date(-1)
     elif menu_state == "set_time":
         update_time(-1)
-    elif menu_state in ["update_confirm", "downgrade_confirm"]:
+    elif menu_state in _CONFIRM_STATES:
         # Do nothing on short press
         pass
     else:
         menu_selection = 1
         activate_menu_item()
-    update_oled_display()
+    display_dirty.set()
 
-@debounce
 def button_k3_pressed():
     global menu_state, menu_selection, ip_octet, last_interaction_time, timeout_flag
     logging.debug("K3 pressed")
-    last_interaction_time = time.time()
+    last_interaction_time = time.monotonic()
     timeout_flag = False
 
-    if menu_state in ["show_network_info", "show_pi_health"]:
+    if menu_state in _INFO_STATES:
         reset_to_main()
     elif menu_state == "default":
         menu_state = "show_pi_health"
@@ -865,29 +1247,28 @@ def button_k3_pressed():
         # Move to the app updates menu when K3 is pressed in application menu
         menu_state = "app_updates"
         menu_selection = 0
-    elif menu_state in ["set_static_ip", "set_static_sm", "set_static_gw", "set_date", "set_time"]:
+    elif menu_state in _EDIT_STATES:
         ip_octet = (ip_octet - 1) % 4  # Corrected to allow all 4 octets
-    if menu_state in ["update_confirm", "downgrade_confirm"]:
+    if menu_state in _CONFIRM_STATES:
         # Cancel action
         menu_state = "update"
         selected_version = None  # Reset selected_version
-        update_oled_display()
+        display_dirty.set()
     else:
         menu_selection = 2
         activate_menu_item()
-    update_oled_display()
+    display_dirty.set()
 
-@debounce
 def button_k4_pressed():
     global menu_state, menu_selection, ip_octet, ip_address, subnet_mask, gateway
     global original_ip_address, original_subnet_mask, original_gateway
     global datetime_temp, last_interaction_time, time_format_24hr, selected_version
     logging.debug("K4 pressed")
-    last_interaction_time = time.time()
+    last_interaction_time = time.monotonic()
 
-    if menu_state in ["show_network_info", "show_pi_health"]:
+    if menu_state in _INFO_STATES:
         reset_to_main()
-    elif menu_state in ["set_static_ip", "set_static_sm", "set_static_gw", "set_date", "set_time"]:
+    elif menu_state in _EDIT_STATES:
         ip_octet = (ip_octet + 1) % 4  # Corrected to allow all 4 octets
     elif menu_state == "update_confirm":
         if selected_version:
@@ -910,114 +1291,125 @@ def button_k4_pressed():
     else:
         menu_selection = 3
         activate_menu_item()
-    update_oled_display()
-    
+    display_dirty.set()
+
 def hold_k3():
     global menu_state, ip_address, subnet_mask, gateway, original_ip_address, original_subnet_mask, original_gateway, last_interaction_time, selected_version
     logging.debug("K3 held for 1 seconds")
-    last_interaction_time = time.time()
+    last_interaction_time = time.monotonic()
 
-    if menu_state in ["set_static_ip", "set_static_sm", "set_static_gw"]:
+    if menu_state in _OCTET_STATES:
         ip_address = original_ip_address[:]
         subnet_mask = original_subnet_mask[:]
         gateway = original_gateway[:]
         menu_state = "set_static"
-    elif menu_state in ["set_date", "set_time"]:
+    elif menu_state in _DATETIME_STATES:
         menu_state = "set_datetime"
+    display_dirty.set()
 
 
 def hold_k4():
     global menu_state, updating_application, ip_address, subnet_mask, gateway, original_ip_address, original_subnet_mask, original_gateway, datetime_temp, last_interaction_time, time_format_24hr, selected_version
     logging.debug("K4 held for 1 seconds")
-    last_interaction_time = time.time()
+    last_interaction_time = time.monotonic()
 
-    if menu_state in ["set_static_ip", "set_static_sm", "set_static_gw"]:
+    if menu_state in _OCTET_STATES:
         save_static_settings()
         apply_static_settings()
         original_ip_address = ip_address[:]
         original_subnet_mask = subnet_mask[:]
         original_gateway = gateway[:]
         menu_state = "set_static"
-    elif menu_state in ["set_date", "set_time"]:
+    elif menu_state in _DATETIME_STATES:
         set_system_datetime(datetime_temp)
         state = load_state()
         state["time_format_24hr"] = time_format_24hr
         save_state(state)
         update_clock_format(time_format_24hr)
-        restart_script()
+        reinitialize_runtime()
+    display_dirty.set()
 
 
 def save_static_settings():
     state = load_state()
-    state["static_ip"] = ip_address
-    state["subnet_mask"] = subnet_mask
-    state["gateway"] = gateway
+    # Copy the octet lists: save_state keeps the dict cached by reference,
+    # and storing the live editor globals would let later (even cancelled)
+    # edits mutate the cache and leak into the next save
+    state["static_ip"] = ip_address[:]
+    state["subnet_mask"] = subnet_mask[:]
+    state["gateway"] = gateway[:]
     save_state(state)
     logging.info(f"Static settings saved: IP {ip_address}, Subnet {subnet_mask}, Gateway {gateway}")
 
 def apply_static_settings():
-    ip_str = '.'.join(map(str, ip_address))
-    sm_str = '.'.join(map(str, subnet_mask))
-    gw_str = '.'.join(map(str, gateway))
-    cidr = subnet_mask_to_cidr(sm_str)
-    execute_command(f"sudo nmcli connection modify {STATIC_PROFILE} ipv4.addresses {ip_str}/{cidr}")
-    execute_command(f"sudo nmcli connection modify {STATIC_PROFILE} ipv4.gateway {gw_str}")
-    execute_command(f"sudo nmcli connection modify {STATIC_PROFILE} ipv4.method manual")
-    execute_command(f"sudo nmcli connection modify {STATIC_PROFILE} ipv4.dns {gw_str}")
-    execute_command(f"sudo nmcli connection up {STATIC_PROFILE}")
+    # inet_ntoa formats the packed octets in one C call
+    sm_bytes = bytes(subnet_mask)
+    ip_str = socket.inet_ntoa(bytes(ip_address))
+    gw_str = socket.inet_ntoa(bytes(gateway))
+    cidr = str(int.from_bytes(sm_bytes, 'big').bit_count())
+    # nmcli takes all the properties in one modify call; one fork instead of
+    # four, and no window where the profile is half-configured
+    execute_command([
+        "sudo", "nmcli", "connection", "modify", STATIC_PROFILE,
+        "ipv4.addresses", f"{ip_str}/{cidr}",
+        "ipv4.gateway", gw_str,
+        "ipv4.method", "manual",
+        "ipv4.dns", gw_str,
+    ])
+    execute_command(["sudo", "nmcli", "connection", "up", STATIC_PROFILE])
     logging.info("Static IP settings applied to the network profile.")
 
+# Per-field delta builders for the date editor, keyed by cursor position
+_DATE_OPS = {
+    0: lambda inc: relativedelta(months=inc),
+    1: lambda inc: relativedelta(days=inc),
+    2: lambda inc: relativedelta(years=inc),
+}
+
 def update_date(increment):
     global datetime_temp
-    try:
-        if ip_octet == 0:
-            new_month = (datetime_temp.month + increment - 1) % 12 + 1
-            datetime_temp = datetime_temp.replace(month=new_month)
-        elif ip_octet == 1:
-            new_day = (datetime_temp.day + increment - 1) % 31 + 1
-            datetime_temp = datetime_temp.replace(day=new_day)
-        elif ip_octet == 2:
-            datetime_temp = datetime_temp.replace(year=datetime_temp.year + increment)
-    except ValueError as e:
-        logging.error(f"Error updating date: {e}")
+    # relativedelta handles month/day/year wraparound with real calendar math
+    op = _DATE_OPS.get(ip_octet)
+    if op is not None:
+        datetime_temp += op(increment)
 
 def update_time(increment):
     global datetime_temp, time_format_24hr
-    try:
-        if ip_octet == 0:
-            time_format_24hr = not time_format_24hr
-        elif ip_octet == 1:
-            new_hour = (datetime_temp.hour + increment) % (24 if time_format_24hr else 12)
-            if new_hour == 0 and not time_format_24hr:
-                new_hour = 12
-            datetime_temp = datetime_temp.replace(hour=new_hour)
-        elif ip_octet == 2:
-            new_minute = (datetime_temp.minute + increment) % 60
-            datetime_temp = datetime_temp.replace(minute=new_minute)
-        elif ip_octet == 3 and not time_format_24hr:
-            am_pm = datetime_temp.strftime("%p")
-            if am_pm == "AM":
-                datetime_temp = datetime_temp.replace(hour=(datetime_temp.hour + 12) % 24)
-            else:
-                datetime_temp = datetime_temp.replace(hour=(datetime_temp.hour - 12) % 24)
-    except ValueError as e:
-        logging.error(f"Error updating time: {e}")
+    if ip_octet == 0:
+        time_format_24hr = not time_format_24hr
+    elif ip_octet == 1:
+        datetime_temp += timedelta(hours=increment)
+    elif ip_octet == 2:
+        datetime_temp += timedelta(minutes=increment)
+    elif ip_octet == 3 and not time_format_24hr:
+        # Directional meridiem flip: always stays within the same day
+        if datetime_temp.hour < 12:
+            datetime_temp += timedelta(hours=12)
+        else:
+            datetime_temp -= timedelta(hours=12)
 
 def set_system_datetime(datetime_temp):
-    date_str = datetime_temp.strftime("%Y-%m-%d")
-    time_str = datetime_temp.strftime("%H:%M" if time_format_24hr else "%I:%M %p")
-    execute_command(f"sudo date --set='{date_str}'")
-    execute_command(f"sudo date --set='{time_str}'")
+    # One fork sets date and time together; the 24-hour form is unambiguous
+    # to date(1) regardless of the display format
+    execute_command(["sudo", "date", "--set", datetime_temp.strftime("%Y-%m-%d %H:%M")])
 
 def restart_script():
     """Restarts the current script."""
     logging.info("Restarting script...")
     os.execv(sys.executable, ['python3'] + sys.argv)
 
-def subnet_mask_to_cidr(mask):
-    mask_octets = map(int, mask.split('.'))
-    binary_str = ''.join([bin(octet).lstrip('0b').zfill(8) for octet in mask_octets])
-    return str(binary_str.count('1'))
+def reinitialize_runtime():
+    """Reapplies persisted display settings in-process.
+
+    Used after a clock-format change, where nothing on disk besides the
+    state file changed; a full os.execv restart (~1-2 s on a Pi Zero) is
+    only warranted when the script source itself was replaced.
+    """
+    global time_format_24hr
+    state = load_state()
+    time_format_24hr = state.get("time_format_24hr", True)
+    get_pi_health.cache_clear()  # Wall clock may have just moved
+    reset_to_main()
 
 def turn_off_oled():
     with oled_lock:
@@ -1028,65 +1420,100 @@ def turn_off_oled():
 def update_clock_format(time_format_24hr):
     config_file_path = os.path.expanduser("~/.config/wf-panel-pi.ini")
 
-    # Read the configuration file
+    clock_format = 'clock_format=%H:%M:%S' if time_format_24hr else 'clock_format=%I:%M:%S %p'
     with open(config_file_path, 'r') as file:
-        lines = file.readlines()
+        text = file.read()
+    new_text = _CLOCK_FMT_RE.sub(clock_format, text, count=1)
 
-    # Modify the clock_format line
-    with open(config_file_path, 'w') as file:
-        for line in lines:
-            if line.startswith('clock_format'):
-                if time_format_24hr:
-                    file.write('clock_format=%H:%M:%S\n')
-                else:
-                    file.write('clock_format=%I:%M:%S %p\n')
-            else:
-                file.write(line)
+    if new_text == text:
+        # Already in the requested format; skip the rewrite and panel restart
+        return
+
+    # Write to a sibling temp file and rename so a crash can't truncate the
+    # panel config mid-write
+    tmp_path = config_file_path + '.tmp'
+    with open(tmp_path, 'w') as file:
+        file.write(new_text)
+    os.replace(tmp_path, config_file_path)
 
     # Restart the panel or system to apply changes
     subprocess.run(['lxpanelctl', 'restart'], check=True)
     logging.info(f"Clock format set to {'24-hour' if time_format_24hr else '12-hour'} with seconds.")
 
+# Shared HTTP session: keep-alive reuses the TLS connection across GitHub
+# calls instead of paying a fresh handshake per request
+_http_session = requests.Session()
+_http_session.headers.update({
+    # Identify the device updater and let GitHub compress the tag JSON
+    'User-Agent': f'Omnicon-Updater/{current_version}',
+    'Accept-Encoding': 'gzip',
+})
+_tags_etag = None
+_tags_cache = []
+
 def download_file_from_github(tag, local_path):
     url = f"https://raw.githubusercontent.com/RUDEWORLD/OMNICON/{tag}/omnicon.py"
+    tmp_path = local_path + '.tmp'
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        with open(local_path, 'w', encoding='utf-8') as file:  # Ensure UTF-8 encoding is used
-            file.write(response.text)
+        # Stream raw bytes straight to disk; response.text would hold the
+        # whole file in RAM as a decoded str and re-encode it on write
+        with _http_session.get(url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            with open(tmp_path, 'wb') as file:
+                shutil.copyfileobj(response.raw, file, length=64 * 1024)
+        # Rename into place so a dropped connection can't leave a
+        # half-written omnicon.py behind
+        os.replace(tmp_path, local_path)
         logging.info(f"Downloaded and saved: {local_path}")
         return True
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, OSError) as e:
         logging.error(f"Failed to download the script: {e}")
         return False
 
 def fetch_github_tags():
+    global _tags_etag, _tags_cache
     url = "https://api.github.com/repos/RUDEWORLD/OMNICON/tags"
+    # Revalidate with the ETag from the previous fetch; an unchanged tag
+    # list comes back as a bodyless 304
+    headers = {'If-None-Match': _tags_etag} if _tags_etag else {}
     try:
-        response = requests.get(url)
+        response = _http_session.get(url, headers=headers, timeout=5)
+        if response.status_code == 304:
+            return _tags_cache
         response.raise_for_status()
-        tags = response.json()
-        return [tag['name'] for tag in tags]
+        _tags_etag = response.headers.get('ETag')
+        _tags_cache = [tag['name'] for tag in response.json()]
+        return _tags_cache
     except requests.exceptions.RequestException as e:
         logging.error(f"Failed to fetch tags from GitHub: {e}")
         return []
 
-def update_omnicon():
-    global available_versions, current_version, selected_version
-    selected_version = None  # Initialize selected_version to None
+# Tags parsed once per fetch into ascending (version_tuple, tag) pairs so
+# the update/downgrade checks are a bisect instead of re-parsing the list
+_parsed_versions = []
+
+def _ensure_versions():
+    global available_versions, _parsed_versions
     if not available_versions:
         available_versions = fetch_github_tags()
-        if not available_versions:
-            return "PLEASE CONNECT\nTO INTERNET"
-    # Use lstrip to remove any leading 'v' or 'V'
-    current_version_tuple = tuple(map(int, current_version.lstrip('vV').split('.')))
-    newer_versions = [
-        v for v in available_versions
-        if tuple(map(int, v.lstrip('vV').split('.'))) > current_version_tuple
-    ]
-    if not newer_versions:
+        parsed = []
+        for tag in available_versions:
+            try:
+                parsed.append((tuple(map(int, tag.lstrip('vV').split('.'))), tag))
+            except ValueError:
+                logging.warning(f"Skipping unparseable tag: {tag}")
+        _parsed_versions = sorted(parsed)
+    return available_versions
+
+def update_omnicon():
+    global selected_version
+    selected_version = None  # Initialize selected_version to None
+    if not _ensure_versions():
+        return "PLEASE CONNECT\nTO INTERNET"
+    i = bisect.bisect_right(_parsed_versions, (_current_version_tuple, '\uffff'))
+    if i >= len(_parsed_versions):
         return "YOU'RE UP TO DATE"
-    selected_version = newer_versions[0]
+    selected_version = _parsed_versions[-1][1]  # Newest available tag
     return "UPDATE AVAILABLE"
 
 
@@ -1099,20 +1526,14 @@ def perform_update(version):
         return "UPDATE FAILED"
 
 def downgrade_omnicon():
-    global available_versions, current_version, selected_version
+    global selected_version
     selected_version = None  # Initialize selected_version to None
-    if not available_versions:
-        available_versions = fetch_github_tags()
-        if not available_versions:
-            return "PLEASE CONNECT\nTO INTERNET"
-    current_version_tuple = tuple(map(int, current_version.strip('V').split('.')))
-    older_versions = [
-        v for v in available_versions
-        if tuple(map(int, v.strip('V').split('.'))) < current_version_tuple
-    ]
-    if not older_versions:
+    if not _ensure_versions():
+        return "PLEASE CONNECT\nTO INTERNET"
+    i = bisect.bisect_left(_parsed_versions, (_current_version_tuple, ''))
+    if i == 0:
         return "NO OLDER VERSIONS"
-    selected_version = older_versions[0]
+    selected_version = _parsed_versions[i - 1][1]  # Nearest older tag
     return "DOWNGRADE AVAILABLE"
 
 def perform_downgrade(version):
@@ -1125,15 +1546,21 @@ def perform_downgrade(version):
 
 # Update OLED display in a separate thread
 def update_oled():
+    # Dedicated render thread: sleeps until a handler flags the display dirty
+    # or the LOOPTIME tick elapses, then renders exactly one frame.
     while True:
-        # Wait for the start of the next second
-        now = datetime.now()
-        sleep_time = 1 - now.microsecond / 1_000_000
-        time.sleep(sleep_time)
+        if menu_state in _TICK_STATES or menu_state in _BLINK_STATES:
+            # Clock/blink content: wake for the periodic repaint too
+            display_dirty.wait(timeout=LOOPTIME)
+        else:
+            # Static menu: sleep until a handler actually changes something
+            display_dirty.wait()
+        display_dirty.clear()
         update_oled_display()
 
 def main():
     global datetime_temp, time_format_24hr
+    psutil.cpu_percent(interval=None)  # Prime the CPU usage counter
     initial_setup()
     datetime_temp = datetime.now()
 
@@ -1145,8 +1572,8 @@ def main():
     button_k3.when_pressed = button_k3_pressed
     button_k4.when_pressed = button_k4_pressed
 
-    button_k1.when_held = lambda: fast_adjust_ip(10)
-    button_k2.when_held = lambda: fast_adjust_ip(-10)
+    button_k1.when_held = lambda: fast_adjust_ip(10, button_k1)
+    button_k2.when_held = lambda: fast_adjust_ip(-10, button_k2)
 
     button_k3.when_held = hold_k3
     button_k4.when_held = hold_k4
@@ -1164,25 +1591,38 @@ def main():
     while True:
         time.sleep(.1)  # Check every 100ms
 
-def fast_adjust_ip(increment):
+def fast_adjust_ip(increment, button):
     global menu_state, ip_octet, ip_address, subnet_mask, gateway, datetime_temp
-    if menu_state == "set_static_ip":
-        ip_address[ip_octet] = (ip_address[ip_octet] + increment) % 256
-    elif menu_state == "set_static_sm":
-        subnet_mask[ip_octet] = (subnet_mask[ip_octet] + increment) % 256
-    elif menu_state == "set_static_gw":
-        gateway[ip_octet] = (gateway[ip_octet] + increment) % 256
-    elif menu_state == "set_date":
-        update_date(increment)
-    elif menu_state == "set_time":
-        update_time(increment)
-    update_oled_display()
-    time.sleep(.6)  # Reduce sleep time to make the changes more responsive
+    # Runs on the button's hold timer thread: repeat for as long as the key
+    # stays down, ramping from a deliberate first step to a fast scroll, and
+    # only wake the render thread when the displayed value actually moved.
+    prev = None
+    delay = 0.6
+    while button.is_held:
+        if menu_state == "set_static_ip":
+            ip_address[ip_octet] = (ip_address[ip_octet] + increment) % 256
+        elif menu_state == "set_static_sm":
+            subnet_mask[ip_octet] = (subnet_mask[ip_octet] + increment) % 256
+        elif menu_state == "set_static_gw":
+            gateway[ip_octet] = (gateway[ip_octet] + increment) % 256
+        elif menu_state == "set_date":
+            update_date(increment)
+        elif menu_state == "set_time":
+            update_time(increment)
+        else:
+            return
+        current = (menu_state, ip_octet, tuple(ip_address), tuple(subnet_mask),
+                   tuple(gateway), datetime_temp)
+        if current != prev:
+            display_dirty.set()
+            prev = current
+        time.sleep(delay)
+        delay = max(0.1, delay * 0.85)
 
 def check_timeout():
     global last_interaction_time
     while True:
-        if time.time() - last_interaction_time > 20:  # 20 seconds timeout
+        if time.monotonic() - last_interaction_time > 20:  # 20 seconds timeout
             reset_to_main()
         time.sleep(1)
 
@@ -1263,7 +1703,7 @@ def activate_menu_item():
     elif menu_state == "reboot_confirm":
         if selected_option == "REBOOT":
             turn_off_oled()
-            execute_command("sudo reboot")
+            execute_command(["sudo", "reboot"])
         elif selected_option == "CANCEL":
             menu_state = "power"
             menu_selection = 0
@@ -1271,7 +1711,7 @@ def activate_menu_item():
     elif menu_state == "shutdown_confirm":
         if selected_option == "SHUTDOWN":
             turn_off_oled()
-            execute_command("sudo shutdown now")
+            execute_command(["sudo", "shutdown", "now"])
         elif selected_option == "CANCEL":
             menu_state = "power"
             menu_selection = 0
@@ -1320,11 +1760,11 @@ def activate_menu_item():
             if is_connected():
                 show_message("UPDATING\nCOMPANION", 2)
                 updating_application = True
-                execute_command_with_progress('echo -e "\\033[A\\n" | sudo companion-update')
+                execute_command_with_progress(["sudo", "companion-update"], input_text="\x1b[A\n\n")
                 updating_application = False
                 show_message("REBOOTING...", 2)
                 turn_off_oled()
-                execute_command("sudo reboot")
+                execute_command(["sudo", "reboot"])
             else:
                 show_message("PLEASE CONNECT\nTO INTERNET", 3)
                 menu_state = "default"
@@ -1332,11 +1772,11 @@ def activate_menu_item():
             if is_connected():
                 show_message("UPDATING\nCOMPANION", 2)
                 updating_application = True
-                execute_command_with_progress('echo -e "\\n" | sudo companion-update')
+                execute_command_with_progress(["sudo", "companion-update"], input_text="\n\n")
                 updating_application = False
                 show_message("REBOOTING...", 2)
                 turn_off_oled()
-                execute_command("sudo reboot")
+                execute_command(["sudo", "reboot"])
             else:
                 show_message("PLEASE CONNECT\nTO INTERNET", 3)
                 menu_state = "default"
@@ -1349,11 +1789,11 @@ def activate_menu_item():
             if is_connected():
                 show_message("UPDATING\nSATELLITE", 2)
                 updating_application = True
-                execute_command_with_progress('echo -e "\\033[A\\n" | sudo satellite-update')
+                execute_command_with_progress(["sudo", "satellite-update"], input_text="\x1b[A\n\n")
                 updating_application = False
                 show_message("REBOOTING...", 2)
                 turn_off_oled()
-                execute_command("sudo reboot")
+                execute_command(["sudo", "reboot"])
             else:
                 show_message("PLEASE CONNECT\nTO INTERNET", 3)
                 menu_state = "default"
@@ -1361,11 +1801,11 @@ def activate_menu_item():
             if is_connected():
                 show_message("UPDATING/nSATELLITE", 2)
                 updating_application = True
-                execute_command_with_progress('echo -e "\\n" | sudo satellite-update')
+                execute_command_with_progress(["sudo", "satellite-update"], input_text="\n\n")
                 updating_application = False
                 show_message("REBOOTING...", 2)
                 turn_off_oled()
-                execute_command("sudo reboot")
+                execute_command(["sudo", "reboot"])
             else:
                 show_message("PLEASE CONNECT\nTO INTERNET", 3)
                 menu_state = "default"
@@ -1403,30 +1843,30 @@ def activate_menu_item():
             menu_state = "default"
             menu_selection = 0
 
-    logging.debug(f"Activated menu item: {selected_option}")
-    update_oled_display()
+    logging.debug("Activated menu item: %s", selected_option)
+    display_dirty.set()
 
 def show_message(message, duration):
     global timeout_flag, message_displayed
     message_displayed = True
-    clear_display()
-    with oled_lock:
-        local_image = Image.new("1", (oled.width, oled.height))
-        local_draw = ImageDraw.Draw(local_image)
+    with frame_lock:
+        clear_display()
+        local_image = frame_image
         # Split message into lines
         lines = message.split('\n')
         font = font12
         # Calculate the total height of the text
-        total_height = sum([local_draw.textsize(line, font=font)[1] for line in lines])
+        total_height = sum(_text_size(font, line)[1] for line in lines)
         # Starting y position
         y = (oled.height - total_height) // 2
         for line in lines:
-            line_width, line_height = local_draw.textsize(line, font=font)
+            line_width, line_height = _text_size(font, line)
             x = (oled.width - line_width) // 2
-            local_draw.text((x, y), line, font=font, fill=255)
+            draw_text(local_image, (x, y), line, font)
             y += line_height
-        oled.image(local_image.rotate(180))
-        oled.show()
+        oled.image(local_image)
+    with oled_lock:
+        oled.fast_show()
     time.sleep(duration)
     message_displayed = False
     timeout_flag = True